@@ -0,0 +1,203 @@
+import os
+import re
+import sys
+
+import numpy as np
+import scipy.sparse
+from numba import njit, prange
+
+DAMPING = 0.85
+SAMPLES = 10000
+
+# Compiled once instead of on every crawl call
+_LINK_RE = re.compile(r"<a\s+(?:[^>]*?)href=\"([^\"]*)\"")
+
+
+@njit(parallel=True, cache=True)
+def _spmv(indptr, indices, data, r, out):
+    """
+    Sparse matrix-vector product out = M @ r for a CSR matrix, with
+    rows split across threads.
+    """
+    for i in prange(out.shape[0]):
+        s = 0.0
+        for k in range(indptr[i], indptr[i + 1]):
+            s += data[k] * r[indices[k]]
+        out[i] = s
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python pagerank.py corpus")
+    corpus = crawl(sys.argv[1])
+    ranks = sample_pagerank(corpus, DAMPING, SAMPLES)
+    print(f"PageRank Results from Sampling (n = {SAMPLES})")
+    for page in sorted(ranks):
+        print(f"  {page}: {ranks[page]:.4f}")
+    ranks = iterate_pagerank(corpus, DAMPING)
+    print(f"PageRank Results from Iteration")
+    for page in sorted(ranks):
+        print(f"  {page}: {ranks[page]:.4f}")
+
+
+def crawl(directory):
+    """
+    Parse a directory of HTML pages and check for links to other pages.
+    Return a dictionary where each key is a page, and values are
+    a list of all other pages in the corpus that are linked to by the page.
+    """
+    pages = dict()
+
+    # Extract all links from HTML files; scandir entries carry their
+    # file type, so no extra stat call per file
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(".html") or not entry.is_file():
+            continue
+        with open(entry.path) as f:
+            contents = f.read()
+            pages[entry.name] = set(_LINK_RE.findall(contents)) - {entry.name}
+
+    # Only include links to other pages in the corpus
+    for filename in pages:
+        pages[filename] = set(
+            link for link in pages[filename]
+            if link in pages
+        )
+
+    return pages
+
+
+def transition_model(corpus, page, damping_factor):
+    """
+    Return a probability distribution over which page to visit next,
+    given a current page.
+
+    With probability `damping_factor`, choose a link at random
+    linked to by `page`. With probability `1 - damping_factor`, choose
+    a link at random chosen from all pages in the corpus.
+    """
+    probDist = dict()
+    links = corpus[page]
+
+    # A page with no outgoing links is treated as linking to every page
+    if len(links) == 0:
+        for p in corpus:
+            probDist[p] = 1 / len(corpus)
+        return probDist
+
+    for p in corpus:
+        probDist[p] = (1 - damping_factor) / len(corpus)
+        if p in links:
+            probDist[p] += damping_factor / len(links)
+
+    return probDist
+
+
+def sample_pagerank(corpus, damping_factor, n):
+    """
+    Return PageRank values for each page by sampling `n` pages
+    according to transition model, starting with a page at random.
+
+    Return a dictionary where keys are page names, and values are
+    their estimated PageRank value (a value between 0 and 1). All
+    PageRank values should sum to 1.
+    """
+    pages = list(corpus)
+    N = len(pages)
+
+    # The distribution for a given page never changes, so build the
+    # dense transition matrix once: row i is the distribution over next
+    # pages when standing on page i. Each row comes from one
+    # evaluation of transition_model rather than restating its logic
+    # here.
+    T = np.empty((N, N), dtype=np.float32)
+    for i, page in enumerate(pages):
+        probDist = transition_model(corpus, page, damping_factor)
+        T[i] = [probDist[p] for p in pages]
+
+    # Sampling by CDF inversion: precompute per-row cumulative sums,
+    # then advance k independent chains per step with one vectorized
+    # comparison instead of one random.choices call per sample.
+    cdf = np.cumsum(T, axis=1)
+    cdf[:, -1] = 1.0
+
+    if n < 1:
+        raise ValueError("n must be at least 1")
+
+    rng = np.random.default_rng()
+    k = min(n, 100)
+
+    # Each chain starts on a page chosen uniformly at random; those
+    # initial states are burn-in only — every counted sample has been
+    # through at least one transition. The last round is trimmed so
+    # exactly n samples are tallied.
+    state = rng.integers(0, N, size=k)
+    counts = np.zeros(N, dtype=np.int64)
+    remaining = n
+    while remaining > 0:
+        u = rng.random(k)
+        state = (cdf[state] > u[:, None]).argmax(axis=1)
+        counts += np.bincount(state[:min(k, remaining)], minlength=N)
+        remaining -= k
+
+    return {page: counts[i] / n for i, page in enumerate(pages)}
+
+
+def iterate_pagerank(corpus, damping_factor):
+    """
+    Return PageRank values for each page by iteratively updating
+    PageRank values until convergence.
+
+    Return a dictionary where keys are page names, and values are
+    their estimated PageRank value (a value between 0 and 1). All
+    PageRank values should sum to 1.
+    """
+    pages = list(corpus)
+    n = len(pages)
+    index = {page: i for i, page in enumerate(pages)}
+
+    # Build the link matrix once in CSR form: row j holds the outgoing
+    # links of page j, each weighted 1/outdegree(j).
+    indptr = [0]
+    indices = []
+    data = []
+    for page in pages:
+        links = corpus[page]
+        for link in links:
+            indices.append(index[link])
+            data.append(1 / len(links))
+        indptr.append(len(indices))
+    # float32 is plenty for the 1e-4 convergence tolerance and halves
+    # the memory traffic of the (memory-bound) SpMV
+    M = scipy.sparse.csr_matrix(
+        (np.array(data, dtype=np.float32), indices, indptr), shape=(n, n)
+    )
+
+    # Pages with no outgoing links distribute their rank uniformly
+    dangling = np.array([len(corpus[page]) == 0 for page in pages])
+
+    # Power iteration over the transposed matrix (rows = incoming
+    # links), with the SpMV rows split across threads.
+    MT = M.T.tocsr()
+    r = np.full(n, 1 / n, dtype=np.float32)
+    r_new = np.empty_like(r)
+    while True:
+        _spmv(MT.indptr, MT.indices, MT.data, r, r_new)
+
+        # Rank mass on dangling pages, summed outside the kernel so
+        # the threads never contend on a shared accumulator
+        danglingSum = r[dangling].sum()
+        r_new *= damping_factor
+        r_new += (1 - damping_factor) / n + damping_factor * danglingSum / n
+
+        if np.max(np.abs(r_new - r)) < 1e-4:
+            break
+
+        # Swap the two buffers instead of allocating a fresh vector
+        r, r_new = r_new, r
+
+    return dict(zip(pages, r_new))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+import collections
+import sys
+
+import numpy as np
+
+from crossword import *
+
+
+class CrosswordCreator():
+
+    def __init__(self, crossword):
+        """Create new CSP crossword generate."""
+        self.crossword = crossword
+        self.domains = {
+            var: self.crossword.words.copy()
+            for var in self.crossword.variables
+        }
+
+        # Neighbor sets and degrees never change, so derive them from
+        # the overlaps in one pass instead of walking the overlaps on
+        # every neighbors() call
+        neighbors = {var: set() for var in self.crossword.variables}
+        for (v1, v2), overlap in self.crossword.overlaps.items():
+            if overlap:
+                neighbors[v1].add(v2)
+        self._neighbors = {
+            var: frozenset(found) for var, found in neighbors.items()
+        }
+        self._degree = {
+            var: len(self._neighbors[var]) for var in self._neighbors
+        }
+
+    def letter_grid(self, assignment):
+        """Return 2D array representing a given assignment."""
+        letters = [
+            [None for _ in range(self.crossword.width)]
+            for _ in range(self.crossword.height)
+        ]
+        for variable, word in assignment.items():
+            direction = variable.direction
+            for k in range(len(word)):
+                i = variable.i + (k if direction == Variable.DOWN else 0)
+                j = variable.j + (k if direction == Variable.ACROSS else 0)
+                letters[i][j] = word[k]
+        return letters
+
+    def print(self, assignment):
+        """Print crossword assignment to the terminal."""
+        letters = self.letter_grid(assignment)
+        for i in range(self.crossword.height):
+            for j in range(self.crossword.width):
+                if self.crossword.structure[i][j]:
+                    print(letters[i][j] or " ", end="")
+                else:
+                    print("█", end="")
+            print()
+
+    def save(self, assignment, filename):
+        """Save crossword assignment to an image file."""
+        from PIL import Image, ImageDraw, ImageFont
+        cell_size = 100
+        cell_border = 2
+        interior_size = cell_size - 2 * cell_border
+        letters = self.letter_grid(assignment)
+
+        # Create a blank canvas
+        img = Image.new(
+            "RGBA",
+            (self.crossword.width * cell_size,
+             self.crossword.height * cell_size),
+            "black"
+        )
+        font = ImageFont.truetype("assets/fonts/OpenSans-Regular.ttf", 80)
+        draw = ImageDraw.Draw(img)
+
+        for i in range(self.crossword.height):
+            for j in range(self.crossword.width):
+                rect = [
+                    (j * cell_size + cell_border,
+                     i * cell_size + cell_border),
+                    ((j + 1) * cell_size - cell_border,
+                     (i + 1) * cell_size - cell_border)
+                ]
+                if self.crossword.structure[i][j]:
+                    draw.rectangle(rect, fill="white")
+                    if letters[i][j]:
+                        _, _, w, h = draw.textbbox(
+                            (0, 0), letters[i][j], font=font
+                        )
+                        draw.text(
+                            (rect[0][0] + ((interior_size - w) / 2),
+                             rect[0][1] + ((interior_size - h) / 2) - 10),
+                            letters[i][j], fill="black", font=font
+                        )
+
+        img.save(filename)
+
+    def solve(self):
+        """
+        Enforce node and arc consistency, and then solve the CSP.
+        """
+        self.enforce_node_consistency()
+        self.encode_domains()
+        self.ac3()
+        self._used_words = set()
+        return self.backtrack(dict())
+
+    def enforce_node_consistency(self):
+        """
+        Update `self.domains` such that each variable is node-consistent.
+        (Remove any values that are inconsistent with a variable's unary
+         constraints; in this case, the length of the word.)
+        """
+        for var in self.domains:
+            for word in self.domains[var].copy():
+                if len(word) != var.length:
+                    self.domains[var].remove(word)
+
+    def encode_domains(self):
+        """
+        Pack each variable's domain into a uint8 array, one word per
+        row, so the arc revision kernel compares raw bytes instead of
+        walking Python strings. `self.domain_words[var]` keeps the
+        words aligned with the rows of `self.domain_arr[var]`.
+        """
+        self.domain_words = dict()
+        self.domain_arr = dict()
+        self._letter_bits = dict()
+        self._conflict_counts = dict()
+        for var in self.domains:
+            words = sorted(self.domains[var])
+            self.domain_words[var] = words
+            self.domain_arr[var] = np.frombuffer(
+                "".join(words).encode(), dtype=np.uint8
+            ).reshape(len(words), var.length)
+
+    def revise(self, x, y):
+        """
+        Make variable `x` arc consistent with variable `y`.
+        To do so, remove values from `self.domains[x]` for which there is
+        no possible corresponding value for `y` in `self.domains[y]`.
+
+        Return True if a revision was made to the domain of `x`; return
+        False if no revision was made.
+        """
+        overlap = self.crossword.overlaps[x, y]
+        if overlap is None:
+            return False
+        ix, iy = overlap
+
+        # Bitset of the letters appearing at y's overlap position,
+        # cached until y's domain actually shrinks. A word of x then
+        # survives iff its letter's bit is set — no inner loop over y.
+        y_bits = self._letter_bits.setdefault(y, dict())
+        mask = y_bits.get(iy)
+        if mask is None:
+            col = self.domain_arr[y][:, iy].astype(np.uint32)
+            mask = np.bitwise_or.reduce(
+                np.uint32(1) << (col - ord("A")), initial=np.uint32(0)
+            )
+            y_bits[iy] = mask
+
+        xcol = self.domain_arr[x][:, ix].astype(np.uint32)
+        keep = ((np.uint32(1) << (xcol - ord("A"))) & mask) != 0
+        if keep.all():
+            return False
+
+        self.domain_arr[x] = self.domain_arr[x][keep]
+        self.domain_words[x] = [
+            word for word, kept in zip(self.domain_words[x], keep) if kept
+        ]
+        self.domains[x] = set(self.domain_words[x])
+        self._letter_bits.pop(x, None)
+        for key in [k for k in self._conflict_counts if x in k]:
+            del self._conflict_counts[key]
+        return True
+
+    def ac3(self, arcs=None):
+        """
+        Update `self.domains` such that each variable is arc consistent.
+        If `arcs` is None, begin with initial list of all arcs in the problem.
+        Otherwise, use `arcs` as the initial list of arcs to make consistent.
+
+        Return True if arc consistency is enforced and no domains are empty;
+        return False if one or more domains end up empty.
+        """
+        arcs = collections.deque(
+            self.crossword.overlaps.keys() if arcs is None else arcs
+        )
+
+        while len(arcs) > 0:
+            x, y = arcs.popleft()
+            if self.revise(x, y):
+                if len(self.domains[x]) == 0:
+                    return False
+                for z in self._neighbors[x]:
+                    if z != y:
+                        arcs.append((z, x))
+
+        return True
+
+    def assignment_complete(self, assignment):
+        """
+        Return True if `assignment` is complete (i.e., assigns a value to each
+        crossword variable); return False otherwise.
+        """
+        return len(assignment) == len(self.crossword.variables)
+
+    def consistent(self, assignment, new_var):
+        """
+        Return True if `assignment` is still consistent after assigning
+        `new_var` (i.e., the new word fits in the crossword without
+        conflicting characters); return False otherwise.
+
+        Only constraints involving `new_var` are checked: the rest of
+        the assignment was already validated as it was built, so each
+        backtracking node costs O(degree) instead of rescanning every
+        assigned pair. `self._used_words` holds the words of the other
+        assigned variables.
+        """
+        word = assignment[new_var]
+
+        # The new value has to be distinct from every assigned word
+        if word in self._used_words:
+            return False
+
+        # The new value has to be the right length
+        if len(word) != new_var.length:
+            return False
+
+        # No conflicts with assigned neighbors
+        for neighbor in self._neighbors[new_var]:
+            if neighbor in assignment:
+                overlap = self.crossword.overlaps[new_var, neighbor]
+                if word[overlap[0]] != assignment[neighbor][overlap[1]]:
+                    return False
+
+        return True
+
+    def order_domain_values(self, var, assignment):
+        """
+        Return a list of values in the domain of `var`, in order by
+        the number of values they rule out for neighboring variables.
+        The first value in the list, for example, should be the one
+        that rules out the fewest values among the neighbors of `var`.
+        """
+        words = self.domain_words[var]
+        scores = np.zeros(len(words), dtype=np.int64)
+
+        for neighbor in self._neighbors[var]:
+            if neighbor in assignment:
+                continue
+
+            # Per-word elimination counts against this neighbor,
+            # computed once from the packed domains and cached until a
+            # domain shrinks
+            counts = self._conflict_counts.get((var, neighbor))
+            if counts is None:
+                ox, oy = self.crossword.overlaps[var, neighbor]
+                counts = (
+                    self.domain_arr[var][:, ox, None]
+                    != self.domain_arr[neighbor][None, :, oy]
+                ).sum(axis=1)
+                self._conflict_counts[var, neighbor] = counts
+            scores += counts
+
+        return [words[i] for i in np.argsort(scores, kind="stable")]
+
+    def select_unassigned_variable(self, assignment):
+        """
+        Return an unassigned variable not already part of `assignment`.
+        Choose the variable with the minimum number of remaining values
+        in its domain. If there is a tie, choose the variable with the
+        highest degree. If there is a tie, any of the tied variables
+        are acceptable return values.
+        """
+        return min(
+            (var for var in self.crossword.variables
+             if var not in assignment),
+            key=lambda var: (len(self.domains[var]), -self._degree[var])
+        )
+
+    def backtrack(self, assignment):
+        """
+        Using Backtracking Search, take as input a partial assignment for the
+        crossword and return a complete assignment if possible to do so.
+
+        `assignment` is a mapping from variables (keys) to words (values).
+
+        If no assignment is possible, return None.
+        """
+        if self.assignment_complete(assignment):
+            return assignment
+
+        var = self.select_unassigned_variable(assignment)
+        for value in self.order_domain_values(var, assignment):
+            # Mutate, recurse, undo — no copying of the assignment
+            assignment[var] = value
+            if self.consistent(assignment, var):
+                self._used_words.add(value)
+                result = self.backtrack(assignment)
+                if result is not None:
+                    return result
+                self._used_words.remove(value)
+            del assignment[var]
+
+        return None
+
+
+def main():
+
+    # Check usage
+    if len(sys.argv) not in [3, 4]:
+        sys.exit("Usage: python generate.py structure words [output]")
+
+    # Parse command-line arguments
+    structure = sys.argv[1]
+    words = sys.argv[2]
+    output = sys.argv[3] if len(sys.argv) == 4 else None
+
+    # Generate crossword
+    crossword = Crossword(structure, words)
+    creator = CrosswordCreator(crossword)
+    assignment = creator.solve()
+
+    # Print result
+    if assignment is None:
+        print("No solution.")
+    else:
+        creator.print(assignment)
+        if output:
+            creator.save(assignment, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+import csv
+import sys
+
+import numpy as np
+
+# Maps lowercased names to a set of person indices
+names = {}
+
+# Maps original CSV person ids to person indices, and back
+pid_to_idx = {}
+person_csv_id = []
+
+# Parallel arrays indexed by person index
+person_name = []
+person_birth = []
+
+# Parallel arrays indexed by movie index
+movie_title = []
+movie_year = []
+
+# CSR incidence arrays: the movies of person i sit in
+# person_movies_indices[person_movies_indptr[i]:person_movies_indptr[i + 1]],
+# and mirrored for the stars of each movie
+person_movies_indptr = None
+person_movies_indices = None
+movie_stars_indptr = None
+movie_stars_indices = None
+
+
+def load_data(directory):
+    """
+    Load data from CSV files into memory, interning the CSV string ids
+    to contiguous integer indices so the search works on int-indexed
+    arrays instead of hashing id strings at every step.
+    """
+    # Load people, assigning each a contiguous index
+    with open(f"{directory}/people.csv", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            idx = len(person_name)
+            pid_to_idx[row["id"]] = idx
+            person_csv_id.append(row["id"])
+            person_name.append(row["name"])
+            person_birth.append(row["birth"])
+            names.setdefault(row["name"].lower(), set()).add(idx)
+
+    # Load movies the same way
+    mid_to_idx = {}
+    with open(f"{directory}/movies.csv", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            idx = len(movie_title)
+            mid_to_idx[row["id"]] = idx
+            movie_title.append(row["title"])
+            movie_year.append(row["year"])
+
+    # Stream stars.csv into two flat edge arrays, then build CSR
+    # index arrays for both directions of the incidence — no per-person
+    # or per-movie Python containers
+    global person_movies_indptr, person_movies_indices
+    global movie_stars_indptr, movie_stars_indices
+    person_rows = []
+    movie_rows = []
+    with open(f"{directory}/stars.csv", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            try:
+                p = pid_to_idx[row["person_id"]]
+                m = mid_to_idx[row["movie_id"]]
+            except KeyError:
+                continue
+            person_rows.append(p)
+            movie_rows.append(m)
+    pr = np.array(person_rows, dtype=np.int32)
+    mr = np.array(movie_rows, dtype=np.int32)
+
+    person_movies_indptr = np.zeros(len(person_name) + 1, dtype=np.int64)
+    person_movies_indptr[1:] = np.bincount(
+        pr, minlength=len(person_name)
+    ).cumsum()
+    person_movies_indices = mr[np.argsort(pr, kind="stable")]
+
+    movie_stars_indptr = np.zeros(len(movie_title) + 1, dtype=np.int64)
+    movie_stars_indptr[1:] = np.bincount(
+        mr, minlength=len(movie_title)
+    ).cumsum()
+    movie_stars_indices = pr[np.argsort(mr, kind="stable")]
+
+
+def main():
+    if len(sys.argv) > 2:
+        sys.exit("Usage: python degrees.py [directory]")
+    directory = sys.argv[1] if len(sys.argv) == 2 else "large"
+
+    # Load data from files into memory
+    print("Loading data...")
+    load_data(directory)
+    print("Data loaded.")
+
+    source = person_id_for_name(input("Name: "))
+    if source is None:
+        sys.exit("Person not found.")
+    target = person_id_for_name(input("Name: "))
+    if target is None:
+        sys.exit("Person not found.")
+
+    path = shortest_path(source, target)
+
+    if path is None:
+        print("Not connected.")
+    else:
+        degrees = len(path)
+        print(f"{degrees} degrees of separation.")
+        path = [(None, source)] + path
+        for i in range(degrees):
+            person1 = person_name[path[i][1]]
+            person2 = person_name[path[i + 1][1]]
+            movie = movie_title[path[i + 1][0]]
+            print(f"{i + 1}: {person1} and {person2} starred in {movie}")
+
+
+def shortest_path(source, target):
+    """
+    Return the shortest list of (movie index, person index) pairs
+    that connect the source to the target.
+
+    If no possible path, returns None.
+    """
+    if source == target:
+        return []
+
+    # Search from both ends at once: each side keeps its own parent
+    # map (person -> (movie, previous person)) and BFS depth, and each
+    # step expands whichever frontier is currently smaller. A plain
+    # BFS explores ~b^d nodes; meeting in the middle costs ~2*b^(d/2).
+    parents_src = {source: None}
+    parents_dst = {target: None}
+    dist_src = {source: 0}
+    dist_dst = {target: 0}
+    frontier_src = [source]
+    frontier_dst = [target]
+
+    while frontier_src and frontier_dst:
+        if len(frontier_src) <= len(frontier_dst):
+            frontier, parents, dist = frontier_src, parents_src, dist_src
+            other = dist_dst
+        else:
+            frontier, parents, dist = frontier_dst, parents_dst, dist_dst
+            other = dist_src
+
+        # Expand one full BFS layer
+        depth = dist[frontier[0]] + 1
+        next_frontier = []
+        for state in frontier:
+            for movie, person in neighbors_for_person(state):
+                person = int(person)
+                if person not in parents:
+                    parents[person] = (int(movie), state)
+                    dist[person] = depth
+                    next_frontier.append(person)
+
+        if frontier is frontier_src:
+            frontier_src = next_frontier
+        else:
+            frontier_dst = next_frontier
+
+        # If the searches met, stitch the halves at the meeting point
+        # closest to the other side
+        meetings = [p for p in next_frontier if p in other]
+        if meetings:
+            meeting = min(meetings, key=lambda person: other[person])
+
+            # Walk back from the meeting point to the source...
+            path = []
+            person = meeting
+            while parents_src[person] is not None:
+                movie, prev = parents_src[person]
+                path.append((movie, person))
+                person = prev
+            path.reverse()
+
+            # ...then forward from the meeting point to the target
+            person = meeting
+            while parents_dst[person] is not None:
+                movie, prev = parents_dst[person]
+                path.append((movie, prev))
+                person = prev
+
+            return path
+
+    return None
+
+
+def person_id_for_name(name):
+    """
+    Returns the person index for a person's name,
+    resolving ambiguities as needed.
+    """
+    person_ids = list(names.get(name.lower(), set()))
+    if len(person_ids) == 0:
+        return None
+    elif len(person_ids) > 1:
+        print(f"Which '{name}'?")
+        for person_id in person_ids:
+            print(
+                f"ID: {person_csv_id[person_id]}, "
+                f"Name: {person_name[person_id]}, "
+                f"Birth: {person_birth[person_id]}"
+            )
+        person_id = pid_to_idx.get(input("Intended Person ID: "))
+        if person_id in person_ids:
+            return person_id
+        return None
+    else:
+        return person_ids[0]
+
+
+def neighbors_for_person(person_id):
+    """
+    Returns (movie index, person index) pairs for people
+    who starred with a given person, gathered straight from the CSR
+    incidence arrays.
+    """
+    start = person_movies_indptr[person_id]
+    end = person_movies_indptr[person_id + 1]
+    person_movies = person_movies_indices[start:end]
+    if person_movies.size == 0:
+        return np.empty((0, 2), dtype=np.int32)
+
+    counts = (
+        movie_stars_indptr[person_movies + 1]
+        - movie_stars_indptr[person_movies]
+    )
+    movie_col = np.repeat(person_movies, counts)
+    person_col = np.concatenate([
+        movie_stars_indices[
+            movie_stars_indptr[m]:movie_stars_indptr[m + 1]
+        ]
+        for m in person_movies
+    ])
+    return np.stack((movie_col, person_col), axis=1)
+
+
+if __name__ == "__main__":
+    main()